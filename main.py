@@ -19,11 +19,26 @@ it gold and stops the replay.
 
 from __future__ import annotations
 
+import mmap
 import sys
-import re
+import threading
+from array import array
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:  # JIT‑compiled marble kernel if available, vectorised NumPy otherwise
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+try:  # linear‑time RE2 matcher if available (pip install google-re2)
+    import re2 as re  # type: ignore
+except ImportError:
+    import re
 
 from direct.showbase.ShowBase import ShowBase  # type: ignore
 from direct.task import Task                   # type: ignore
@@ -32,7 +47,6 @@ from panda3d.core import (                     # type: ignore
     CardMaker,
     DirectionalLight,
     TextNode,
-    Vec3,
     Vec4,
     WindowProperties,
 )
@@ -44,10 +58,12 @@ from panda3d.core import (                     # type: ignore
 LINE_TIME: float      = 0.4        # seconds per log line
 STEP_DIST: float      = 4.0        # units advanced per *alive* ping
 SPEED: float          = STEP_DIST / LINE_TIME  # auto‑derived marble speed
+MAX_FRAME_DT: float   = 0.25       # longest frame time fed to log playback (s)
 
 FLOOR_HALF: int       = 1_000      # half‑size of the grey floor (→ 2000×2000)
 START_Y: int          = 0          # Y coordinate of the starting line
 LANES_X: List[int]    = [-15, -5, 5, 15]  # 4 starting X positions for marbles
+MARBLE_Z: float       = 1.5        # height of a marble's centre above the floor
 
 CAMERA_OFFSET: int    = 60         # camera sits 60 units behind the start
 CAMERA_HEIGHT: int    = 35         # …and 35 units above the ground
@@ -61,8 +77,90 @@ MOUSE_SENSITIVITY: float = 0.16    # degrees per pixel
 # Compiled regexen 🕵️‍♀️
 # ---------------------------------------------------------------------------
 
-R_ALIVE = re.compile(r"The player \d+\(([^)]+)\) is alive\.")
-R_WIN   = re.compile(r"The player \d+\(([^)]+)\) has won\.")
+# one alternation for both event kinds: group 1 = name, group 2 = kind.
+# Bytes pattern: it runs straight over the memory‑mapped log. Anchored at the
+# start of a line (leading blanks allowed), so at most one event per line.
+R_COMBINED = re.compile(
+    rb"(?m)^[ \t]*The player \d+\(([^)\n]+)\) (is alive|has won)\."
+)
+
+# ---------------------------------------------------------------------------
+# Log parsing 📜
+# ---------------------------------------------------------------------------
+
+def _parse_log(log_path: Path) -> Tuple[List[str], array]:
+    """Scan the log once, returning parallel *names* / *wins* columns.
+
+    The file is memory‑mapped and matched in place; only the captured names
+    are decoded, once per distinct name. Parsing stops at the first *win*
+    line: nothing after it is replayed. Safe to run off the main thread.
+    """
+    names: List[str] = []
+    wins = array("B")
+    if log_path.stat().st_size == 0:  # mmap refuses empty files
+        return names, wins
+
+    decoded: Dict[bytes, str] = {}
+    with log_path.open("rb") as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for m in R_COMBINED.finditer(mm):
+            raw = m.group(1)
+            name = decoded.get(raw)
+            if name is None:
+                name = decoded[raw] = raw.decode("utf‑8")
+            names.append(name)
+            wins.append(m.group(2)[0] == ord("h"))
+            if wins[-1]:
+                break
+    return names, wins
+
+
+def _parse_in_background(log_path: Path) -> Future:
+    """Run :func:`_parse_log` on a daemon thread and return its future.
+
+    A daemon thread (rather than an executor, whose workers are joined at
+    interpreter exit) lets Escape quit immediately during a long parse.
+    """
+    future: Future = Future()
+
+    def work() -> None:
+        try:
+            future.set_result(_parse_log(log_path))
+        except Exception as exc:  # re‑raised by result() on the main thread
+            future.set_exception(exc)
+
+    threading.Thread(target=work, name="log‑parse", daemon=True).start()
+    return future
+
+# ---------------------------------------------------------------------------
+# Marble kinematics ⚙️
+# ---------------------------------------------------------------------------
+
+def _step_loop(travelled, target, step, moved):
+    """Advance every marble by at most *step* towards its target, in place.
+
+    *moved[i]* is set to 1 for marbles that advanced this frame, 0 otherwise.
+    Only used once compiled by Numba: a plain Python loop would be slow.
+    """
+    for i in range(travelled.shape[0]):
+        remaining = target[i] - travelled[i]
+        if remaining > 0:
+            travelled[i] += min(step, remaining)
+            moved[i] = 1
+        else:
+            moved[i] = 0
+
+
+def _step_numpy(travelled, target, step, moved):
+    """Same contract as :func:`_step_loop`, as a few vectorised NumPy ops."""
+    delta = np.minimum(step, np.maximum(0, target - travelled))
+    travelled += delta
+    np.greater(delta, 0, out=moved)
+
+
+_step_kernel = (
+    njit(cache=True, fastmath=True)(_step_loop) if njit is not None else _step_numpy
+)
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -70,17 +168,16 @@ R_WIN   = re.compile(r"The player \d+\(([^)]+)\) has won\.")
 
 @dataclass
 class Player:
-    """All the scene graph nodes that belong to a marble + its state."""
+    """All the scene graph nodes that belong to a marble.
+
+    Its progress lives in the app's ``_travelled`` / ``_target`` arrays, at
+    index *slot*.
+    """
 
+    name: str          # champion name, as found in the log
+    slot: int          # index into the per‑marble arrays
     model: "NodePath"  # the marble mesh
     label: "NodePath"  # billboarded text above the marble
-    travelled: float = 0.0  # how far we have actually moved (Z)
-    target: float    = 0.0  # how far we *should* be after the last tick
-
-    def move(self, delta: float) -> None:
-        """Move the marble *delta* units forward on Y."""
-        self.travelled += delta
-        self.model.set_y(self.model, delta)  # local‑axis move
 
 # ---------------------------------------------------------------------------
 # Main application 🍿
@@ -90,15 +187,23 @@ class CorewarMarble(ShowBase):
     """Panda3D application driving the marble animation."""
 
     _players: Dict[str, Player]
+    _marbles: List[Player]     # players by slot
+    _lane_x: List[int]         # X of each marble's lane, by slot
+    _travelled: np.ndarray     # how far each marble has actually moved (Y)
+    _target: np.ndarray        # how far each marble *should* be after the last tick
+    _moved: np.ndarray         # 1 for marbles that moved this frame
     _next_lane: int
-    _log_lines: Iterator[str]
+    _events: Optional[List[Player]]  # event column: who pinged (None while parsing)
+    _wins: array           # event column: 1 if the event is a win, else 0
+    _idx: int              # next event to replay
 
-    def __init__(self, lines: Iterable[str]) -> None:  # noqa: D401
+    def __init__(self, parsed: Future) -> None:  # noqa: D401
         super().__init__()
 
         # -- Window & free‑cam set‑up --------------------------------------
         props = WindowProperties()
         props.setCursorHidden(True)
+        props.setMouseMode(WindowProperties.M_relative)  # no per‑frame warping
         self.win.requestProperties(props)
         self.disableMouse()
 
@@ -109,16 +214,33 @@ class CorewarMarble(ShowBase):
         self._build_floor()
         self._setup_lighting()
 
+        # loaded once; every marble is a copy sharing the same Geom
+        self._smiley_template = self.loader.loadModel("models/smiley")
+        self._smiley_template.detach_node()
+
         # -- State ----------------------------------------------------------
         self._players = {}
+        self._marbles = []
+        self._lane_x = []
+        self._travelled = np.zeros(0, dtype=np.float64)
+        self._target = np.zeros(0, dtype=np.float64)
+        self._moved = np.zeros(0, dtype=np.uint8)
         self._next_lane = 0
-        self._log_lines = self._clean(lines)
+        # warm‑up: pay the JIT compile now rather than on the first frame
+        _step_kernel(
+            np.zeros(1, dtype=np.float64), np.ones(1, dtype=np.float64),
+            0.0, np.zeros(1, dtype=np.uint8),
+        )
+        self._parsed = parsed
+        self._events = None
+        self._wins = array("B")
+        self._idx = 0
+        self.tick_dt: float = LINE_TIME  # seconds per log line, read every frame
+        self._tick_acc: float = 0.0
 
         # -- Task chain -----------------------------------------------------
-        self.task_mgr.add(self._update_mouse, "🌈 mouse‑look")
-        self.task_mgr.add(self._update_movement, "🚀 free‑cam‑move")
-        self.task_mgr.add(self._lerp_marbles, "🐣 smooth‑marble‑motion")
-        self.task_mgr.doMethodLater(LINE_TIME, self._tick_log, "📜 replay‑log")
+        self.task_mgr.add(self._update, "🌈 per‑frame‑update")
+        self.task_mgr.add(self._await_parse, "📜 await‑log‑parse")
 
     # ------------------------------------------------------------------
     # 🌟  Camera helpers
@@ -132,10 +254,22 @@ class CorewarMarble(ShowBase):
         self._heading: float = 0.0
         self._pitch: float = 0.0
 
-        # store centre of the window for cursor warping
+        # relative mode is only honoured on some platforms (not Windows);
+        # process the pending request now and see what we actually got
+        self.graphicsEngine.openWindows()
+        mode = self.win.getProperties().getMouseMode()
+        self._relative_mouse: bool = mode == WindowProperties.M_relative
+
+        # centre of the window, for cursor warping when not in relative mode
         self._cx = self.win.get_x_size() // 2
         self._cy = self.win.get_y_size() // 2
-        self.win.movePointer(0, self._cx, self._cy)
+        if not self._relative_mouse:
+            self.win.movePointer(0, self._cx, self._cy)
+
+        # last pointer reading; mouse‑look works on the difference
+        md = self.win.getPointer(0)
+        self._mx: float = md.get_x()
+        self._my: float = md.get_y()
 
     # Key‑handling -------------------------------------------------------
 
@@ -150,45 +284,6 @@ class CorewarMarble(ShowBase):
     def _set_key(self, key: str, state: bool) -> None:
         self._keys[key] = state
 
-    # Mouse‑look ---------------------------------------------------------
-
-    def _update_mouse(self, task: Task) -> Task:
-        md = self.win.getPointer(0)
-        dx = md.get_x() - self._cx
-        dy = md.get_y() - self._cy
-
-        self._heading -= dx * MOUSE_SENSITIVITY
-        self._pitch = max(-90, min(90, self._pitch - dy * MOUSE_SENSITIVITY))
-
-        self.camera.set_hpr(self._heading, self._pitch, 0)
-        self.win.movePointer(0, self._cx, self._cy)
-        return Task.cont
-
-    # Keyboard movement --------------------------------------------------
-
-    def _update_movement(self, task: Task) -> Task:
-        dt = globalClock.getDt()
-        direction = Vec3(0)
-        q = self.camera.getQuat()
-
-        if self._keys["w"]:
-            direction += q.getForward()
-        if self._keys["s"]:
-            direction -= q.getForward()
-        if self._keys["a"]:
-            direction -= q.getRight()
-        if self._keys["d"]:
-            direction += q.getRight()
-        if self._keys["q"]:
-            direction += q.getUp()
-        if self._keys["e"]:
-            direction -= q.getUp()
-
-        if direction.length_squared() > 0:
-            speed = FLY_SPEED * (SPRINT_FACTOR if self._keys["shift"] else 1)
-            self.camera.set_pos(self.camera.get_pos() + direction.normalized() * speed * dt)
-        return Task.cont
-
     # ------------------------------------------------------------------
     # 🌟  Scene helpers
     # ------------------------------------------------------------------
@@ -218,14 +313,14 @@ class CorewarMarble(ShowBase):
         if name in self._players:
             return self._players[name]
 
-        lane_x = LANES_X[self._next_lane % len(LANES_X)]
+        slot = self._next_lane
+        lane_x = LANES_X[slot % len(LANES_X)]
         self._next_lane += 1
 
         # --- model ------------------------------------------------------
-        ball = self.loader.loadModel("models/smiley")
+        ball = self._smiley_template.copy_to(self.render)  # copy: recoloured on win
         ball.set_scale(1.0)
-        ball.set_pos(lane_x, START_Y, 1.5)
-        ball.reparent_to(self.render)
+        ball.set_pos(lane_x, START_Y, MARBLE_Z)
 
         # --- name label --------------------------------------------------
         tn = TextNode(f"label‑{name}")
@@ -236,53 +331,97 @@ class CorewarMarble(ShowBase):
         label_np.set_pos(0, 0, 1.8)
         label_np.set_billboard_axis()
 
-        player = Player(model=ball, label=label_np)
+        player = Player(name=name, slot=slot, model=ball, label=label_np)
         self._players[name] = player
+        self._marbles.append(player)
+        self._lane_x.append(lane_x)
+        self._travelled = np.append(self._travelled, np.float64(0))
+        self._target = np.append(self._target, np.float64(0))
+        self._moved = np.append(self._moved, np.uint8(0))
         return player
 
-    # Smooth interpolation ---------------------------------------------
+    # ------------------------------------------------------------------
+    # 🌟  Per‑frame update
+    # ------------------------------------------------------------------
 
-    def _lerp_marbles(self, task: Task) -> Task:
+    def _update(self, task: Task) -> Task:
+        """Mouse‑look, free‑cam movement and marble motion in one task."""
         dt = globalClock.getDt()
+        camera = self.camera
+        win = self.win
+        keys = self._keys
+
+        # -- mouse‑look ----------------------------------------------------
+        md = win.getPointer(0)
+        mx, my = md.get_x(), md.get_y()
+        dx, dy = mx - self._mx, my - self._my
+        self._mx, self._my = mx, my
+
+        if dx or dy:
+            self._heading -= dx * MOUSE_SENSITIVITY
+            self._pitch = max(-90, min(90, self._pitch - dy * MOUSE_SENSITIVITY))
+            camera.set_hpr(self._heading, self._pitch, 0)
+            if not self._relative_mouse:  # absolute pointer: re‑centre it
+                win.movePointer(0, self._cx, self._cy)
+                self._mx, self._my = self._cx, self._cy
+
+        # -- keyboard movement ---------------------------------------------
+        # -1/0/+1 per axis; opposite keys cancel out
+        sx = keys["d"] - keys["a"]
+        sy = keys["w"] - keys["s"]
+        sz = keys["q"] - keys["e"]
+        if sx or sy or sz:  # idle frames skip the quat calls
+            q = camera.getQuat()
+            direction = q.getRight() * sx + q.getForward() * sy + q.getUp() * sz
+            speed = FLY_SPEED * (SPRINT_FACTOR if keys["shift"] else 1)
+            camera.set_pos(camera.get_pos() + direction.normalized() * speed * dt)
+
+        # -- log playback ----------------------------------------------------
+        events = self._events
+        if events is not None and self._idx < len(events):  # idle once replayed
+            # dt is clamped so a long frame cannot replay a burst of events
+            self._tick_acc += min(dt, MAX_FRAME_DT)
+            while self._tick_acc >= self.tick_dt and self._idx < len(events):
+                self._tick_acc -= self.tick_dt
+                self._advance_one()
+
+        # -- smooth marble interpolation ------------------------------------
         step = SPEED * dt
-        for player in self._players.values():
-            if player.travelled < player.target:
-                remaining = player.target - player.travelled
-                player.move(min(step, remaining))
+        _step_kernel(self._travelled, self._target, step, self._moved)
+        # one absolute write per moving marble; idle ones are left untouched
+        marbles, lane_x, travelled = self._marbles, self._lane_x, self._travelled
+        for i in np.flatnonzero(self._moved):
+            marbles[i].model.set_pos(lane_x[i], START_Y + float(travelled[i]), MARBLE_Z)
+
         return Task.cont
 
     # ------------------------------------------------------------------
     # 🌟  Log playback
     # ------------------------------------------------------------------
 
-    def _tick_log(self, task: Task) -> Task:
+    def _await_parse(self, task: Task) -> Task:
+        """Poll the background parse; install the events once it is done."""
+        if not self._parsed.done():
+            return Task.cont
+
         try:
-            line = next(self._log_lines)
-        except StopIteration:
-            return Task.done
-
-        if match := R_ALIVE.match(line):
-            name = match.group(1)
-            player = self._ensure_player(name)
-            player.target += STEP_DIST
-        elif match := R_WIN.match(line):
-            name = match.group(1)
-            player = self._ensure_player(name)
-            player.target += STEP_DIST
+            names, self._wins = self._parsed.result()
+        except (OSError, ValueError) as exc:  # ValueError covers bad UTF‑8
+            sys.exit(f"Lecture impossible : {exc}")
+        # resolve names once so the replay never touches the players dict
+        self._events = [self._ensure_player(name) for name in names]
+        return Task.done
+
+    def _advance_one(self) -> None:
+        """Replay the next pre‑parsed event."""
+        player = self._events[self._idx]
+        is_win = self._wins[self._idx]
+        self._idx += 1
+
+        self._target[player.slot] += STEP_DIST
+        if is_win:
             player.model.set_color(Vec4(1, 0.84, 0, 1))  # gold 🏆
-            print(f"🏆  {name} a gagné !")
-            return Task.done
-
-        return Task.again
-
-    # ------------------------------------------------------------------
-    # 🌟  Misc.
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _clean(lines: Iterable[str]) -> Iterator[str]:
-        """Return an iterator of non‑blank, stripped lines."""
-        return (l.strip() for l in lines if l.strip())
+            print(f"🏆  {player.name} a gagné !")
 
 
 # ---------------------------------------------------------------------------
@@ -298,8 +437,8 @@ def main() -> None:  # noqa: D401
     if not log_path.is_file():
         sys.exit(f"Fichier introuvable : {log_path}")
 
-    with log_path.open(encoding="utf‑8") as fp:
-        CorewarMarble(fp.readlines()).run()
+    # parse on a worker thread while Panda3D opens the window
+    CorewarMarble(_parse_in_background(log_path)).run()
 
 
 if __name__ == "__main__":